@@ -0,0 +1,36 @@
+"""Add unique (chore_id, user_id) to assignments
+
+Revision ID: 130bc7ac909f
+Revises: 56faadab6c6f
+Create Date: 2026-10-18 00:50:12.418233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '130bc7ac909f'
+down_revision: Union[str, None] = '56faadab6c6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # keep the oldest assignment for any duplicated (chore_id, user_id) pair
+    op.execute(sa.text("""
+        DELETE FROM assignments a
+        USING assignments b
+        WHERE a.chore_id = b.chore_id
+          AND a.user_id = b.user_id
+          AND a.id > b.id
+    """))
+    op.create_unique_constraint('uq_assignments_chore_user', 'assignments', ['chore_id', 'user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_assignments_chore_user', 'assignments', type_='unique')
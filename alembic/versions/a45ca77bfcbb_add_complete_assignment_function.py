@@ -0,0 +1,71 @@
+"""Add complete_assignment function
+
+Revision ID: a45ca77bfcbb
+Revises: 130bc7ac909f
+Create Date: 2026-10-18 01:02:47.113052
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a45ca77bfcbb'
+down_revision: Union[str, None] = '130bc7ac909f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Completing an assignment and flipping the chore must see every other
+    # assignment's latest state. Locking the chore row first serializes
+    # completions of the same chore; each following statement takes a fresh
+    # snapshot, so the last completer always observes the others.
+    op.execute(sa.text("""
+        CREATE OR REPLACE FUNCTION complete_assignment(p_assignment_id integer, p_username text)
+        RETURNS TABLE (status text, assignment_chore_id integer, chore_completed boolean)
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            v_chore_id integer;
+            v_owner_id integer;
+            v_user_id integer;
+        BEGIN
+            SELECT a.chore_id, a.user_id INTO v_chore_id, v_owner_id
+            FROM assignments a
+            WHERE a.id = p_assignment_id;
+
+            IF NOT FOUND THEN
+                RETURN QUERY SELECT 'not_found'::text, NULL::integer, false;
+                RETURN;
+            END IF;
+
+            SELECT u.id INTO v_user_id FROM users u WHERE u.username = p_username;
+
+            IF v_user_id IS DISTINCT FROM v_owner_id THEN
+                RETURN QUERY SELECT 'forbidden'::text, v_chore_id, false;
+                RETURN;
+            END IF;
+
+            PERFORM 1 FROM chores c WHERE c.id = v_chore_id FOR UPDATE;
+
+            UPDATE assignments a SET completed_by = v_user_id WHERE a.id = p_assignment_id;
+
+            UPDATE chores c SET completed = TRUE
+            WHERE c.id = v_chore_id
+              AND NOT EXISTS (
+                  SELECT 1 FROM assignments a
+                  WHERE a.chore_id = v_chore_id AND a.completed_by IS NULL
+              );
+
+            RETURN QUERY SELECT 'completed'::text, v_chore_id, FOUND;
+        END;
+        $$
+    """))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(sa.text("DROP FUNCTION IF EXISTS complete_assignment(integer, text)"))
@@ -0,0 +1,85 @@
+"""
+Benchmark assign_users_to_chore against the old one-INSERT-per-assignee loop.
+
+Each size runs inside a transaction that is rolled back, so the database is
+left untouched.
+
+    python -m benchmarks.assign_users --sizes 1 10 100 1000 --repeat 20
+"""
+import argparse
+import statistics
+import time
+import uuid
+import sqlalchemy
+from src import database as db
+from src.api.assignments import assign_users_to_chore
+
+
+def _assign_row_by_row(conn, chore_id: int, assignee_ids: list[int]):
+    for user_id in assignee_ids:
+        conn.execute(
+            sqlalchemy.text("""
+                INSERT INTO assignments (chore_id, user_id, assigned_at)
+                VALUES (:chore_id, :user_id, NOW())
+            """),
+            {"chore_id": chore_id, "user_id": user_id}
+        )
+
+
+def _setup(conn, size: int) -> tuple[list[int], int]:
+    tag = uuid.uuid4().hex[:8]
+    group_id = conn.execute(sqlalchemy.text("""
+        INSERT INTO groups (group_name, created_at, invite_code)
+        VALUES (:name, NOW(), 'BENCH')
+        RETURNING id
+    """), {"name": f"bench-{tag}"}).scalar_one()
+    user_ids = conn.execute(sqlalchemy.text("""
+        INSERT INTO users (username, email, is_admin, group_id)
+        SELECT 'bench-' || :tag || '-' || n, 'bench-' || :tag || '-' || n || '@example.com', false, :group_id
+        FROM generate_series(1, :size) AS n
+        RETURNING id
+    """), {"tag": tag, "size": size, "group_id": group_id}).scalars().all()
+    return user_ids, group_id
+
+
+def _new_chore(conn, group_id: int, created_by: int) -> int:
+    return conn.execute(sqlalchemy.text("""
+        INSERT INTO chores (name, description, group_id, due_date, created_by, completed, created_at)
+        VALUES ('bench', 'bench', :group_id, NOW(), :created_by, false, NOW())
+        RETURNING id
+    """), {"group_id": group_id, "created_by": created_by}).scalar_one()
+
+
+def run(sizes: list[int], repeat: int) -> list[dict]:
+    results = []
+    for size in sizes:
+        row = {"assignees": size}
+        for label, assign in (("set_based", assign_users_to_chore), ("row_by_row", _assign_row_by_row)):
+            timings = []
+            with db.engine.connect() as conn:
+                with conn.begin() as tx:
+                    user_ids, group_id = _setup(conn, size)
+                    for _ in range(repeat):
+                        chore_id = _new_chore(conn, group_id, user_ids[0])
+                        started = time.perf_counter()
+                        assign(conn, chore_id, user_ids)
+                        timings.append((time.perf_counter() - started) * 1000)
+                    tx.rollback()
+            row[f"{label}_ms"] = statistics.median(timings)
+        results.append(row)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    print(f"{'assignees':>10} {'set-based ms':>14} {'row-by-row ms':>14}")
+    for row in run(args.sizes, args.repeat):
+        print(f"{row['assignees']:>10} {row['set_based_ms']:>14.2f} {row['row_by_row_ms']:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
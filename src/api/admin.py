@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 import sqlalchemy
 from src import database as db
-from src.api import auth
+from src import cache
+from src.api import auth, identity
 
 router = APIRouter(
     prefix="/admin",
@@ -9,7 +10,7 @@ router = APIRouter(
     dependencies=[Depends(auth.get_api_key)],
 )
 
-def require_admin(user=Depends(auth.get_current_user)):
+async def require_admin(user=Depends(auth.get_current_user)):
     """
     Checks if the current user is an admin. Raises 403 if not.
     """
@@ -18,24 +19,27 @@ def require_admin(user=Depends(auth.get_current_user)):
     return user
 
 @router.post("/reset", status_code=status.HTTP_200_OK)
-def reset_database(user=Depends(require_admin)):
+async def reset_database(user=Depends(require_admin)):
     """
     Admin-only. Resets the database by truncating all key tables.
     Removes all data but keeps the schema intact.
     """
-    with db.engine.begin() as connection:
+    def transaction(connection):
         connection.execute(sqlalchemy.text(
             "TRUNCATE TABLE assignments, chores, users, groups RESTART IDENTITY CASCADE"
         ))
 
+    await db.run_transaction(transaction)
+    identity.invalidate_all()
+    auth.user_contexts.clear()
     return {"message": "Database reset successfully."}
 
 @router.delete("/remove_user/{user_id}", status_code=200)
-def remove_user(username: str, user=Depends(require_admin)):
+async def remove_user(username: str, user=Depends(require_admin)):
     """
     Admin-only. Permanently deletes a user and related assignments.
     """
-    with db.engine.begin() as conn:
+    def transaction(conn):
         # Delete assignments for this user first
         conn.execute(
             sqlalchemy.text("DELETE FROM assignments WHERE user_id = (SELECT id FROM users WHERE username = :username)"),
@@ -43,11 +47,24 @@ def remove_user(username: str, user=Depends(require_admin)):
         )
         # Now delete the user
         result = conn.execute(
-            sqlalchemy.text("DELETE FROM users WHERE username = :username RETURNING username"),
+            sqlalchemy.text("DELETE FROM users WHERE username = :username RETURNING id"),
             {"username": username}
         ).fetchone()
 
         if not result:
             raise HTTPException(status_code=404, detail="User not found")
 
+        return result.id
+
+    user_id = await db.run_transaction(transaction)
+    identity.invalidate_user(username)
+    auth.invalidate_user_context(user_id)
     return {"message": f"User {username} deleted."}
+
+
+@router.get("/cache-stats")
+async def get_cache_stats(user=Depends(require_admin)):
+    """
+    Admin-only. Size and hit/miss counters of the in-process caches.
+    """
+    return cache.all_stats()
@@ -3,7 +3,7 @@ from pydantic import BaseModel
 import sqlalchemy
 from datetime import datetime
 from src import database as db
-from src.api import auth
+from src.api import auth, identity
 
 router = APIRouter(
     prefix="/assignments",
@@ -24,14 +24,14 @@ class CompleteAssignmentResponse(BaseModel):
     completed_by: str
 
 @router.post("/", response_model=AssignmentResponse)
-def create_assignment(
+async def create_assignment(
     assignment: AssignmentCreate,
     api_key: str = Depends(auth.get_api_key)
 ):
     """
     Create a new assignment by linking a user to a chore.
     """
-    with db.engine.begin() as conn:
+    def transaction(conn):
         # Ensure chore exists
         chore_exists = conn.execute(
             sqlalchemy.text("SELECT 1 FROM chores WHERE id = :id"),
@@ -41,112 +41,70 @@ def create_assignment(
             raise HTTPException(status_code=404, detail="Chore not found.")
 
         # Ensure user exists
-        user_row = conn.execute(
-            sqlalchemy.text("SELECT id FROM users WHERE username = :username"),
-            {"username": assignment.username}
-        ).mappings().fetchone()
-        # user_exists = conn.execute(
-        #     sqlalchemy.text("SELECT 1 FROM users WHERE id = :id"),
-        #     {"id": assignment.user_id}
-        # ).first()
-        if not user_row:
+        user_id = identity.get_user_id(conn, assignment.username)
+        if not user_id:
             raise HTTPException(status_code=404, detail="User not found.")
 
-        user_id = user_row["id"]
-
         # Create assignment with assigned_at
-        result = conn.execute(
-            sqlalchemy.text("""
-                INSERT INTO assignments (chore_id, user_id, assigned_at)
-                VALUES (:chore_id, :user_id, NOW())
-                RETURNING id
-            """),
-            {"chore_id": assignment.chore_id, "user_id": user_id}
-        ).mappings().fetchone()
+        created = assign_users_to_chore(conn, assignment.chore_id, [user_id])
+        if not created:
+            raise HTTPException(status_code=409, detail="User is already assigned to this chore.")
+
+        return AssignmentResponse(
+            message="Assignment created successfully.",
+            assignment_id=created[0]
+        )
 
-    return AssignmentResponse(
-        message="Assignment created successfully.",
-        assignment_id=result["id"]
-    )
+    return await db.run_transaction(transaction)
 
 @router.patch("/{assignment_id}/complete", response_model=CompleteAssignmentResponse)
-def mark_assignment_complete(
+async def mark_assignment_complete(
     assignment_id: int,
     username: str,
     api_key: str = Depends(auth.get_api_key)
 ):
+    """
+    Mark an assignment complete for its owner. The chore is marked completed
+    once every one of its assignments is done.
 
-    with db.engine.begin() as conn:
-        # Ensure assignment exists
-        assignment = conn.execute(
-            sqlalchemy.text("SELECT * FROM assignments WHERE id = :id"),
-            {"id": assignment_id}
-        ).mappings().fetchone()
-        if not assignment:
-            raise HTTPException(status_code=404, detail="Assignment not found.")
-
-        # Ensure user matches the assignment
-        if assignment["user_id"] != conn.execute(
-            sqlalchemy.text("SELECT id FROM users WHERE username = :username"),
-            {"username": username}
-        ).scalar():
-            raise HTTPException(status_code=403, detail="User does not own this assignment.")
-
-        user_id = conn.execute(
-            sqlalchemy.text("SELECT id FROM users WHERE username = :username"),
-            {"username": username}
-        ).scalar()
-
-        if not user_id:
-            raise HTTPException(status_code=404, detail="User not found.")
-
-        # Mark as complete
-        conn.execute(
+    Runs as a single call to the `complete_assignment` database function,
+    which locks the chore row so concurrent completions cannot both miss
+    flipping it.
+    """
+    def transaction(conn):
+        result = conn.execute(
             sqlalchemy.text("""
-                UPDATE assignments SET completed_by = :user_id
-                WHERE id = :id
+                SELECT status, assignment_chore_id, chore_completed
+                FROM complete_assignment(:id, :username)
             """),
-            {"id": assignment_id, "user_id": user_id}
-        )
+            {"id": assignment_id, "username": username}
+        ).mappings().one()
 
-        # Get the chore_id for this assignment
-        chore_id = conn.execute(
-            sqlalchemy.text("SELECT chore_id FROM assignments WHERE id = :assignment_id"),
-            {"assignment_id": assignment_id}
-        ).scalar()
+        if result["status"] == "not_found":
+            raise HTTPException(status_code=404, detail="Assignment not found.")
+        if result["status"] == "forbidden":
+            raise HTTPException(status_code=403, detail="User does not own this assignment.")
 
-        # Check if all assignments for this chore are completed
-        all_completed = conn.execute(
-            sqlalchemy.text("""
-                SELECT COUNT(*) = SUM(CASE WHEN completed_by IS NOT NULL THEN 1 ELSE 0 END)
-                FROM assignments
-                WHERE chore_id = :chore_id
-            """),
-            {"chore_id": chore_id}
-        ).scalar()
+        return CompleteAssignmentResponse(
+            message="Marked assignment as complete.",
+            completed_by=username
+        )
 
-        # If all are complete, mark the chore as completed
-        if all_completed:
-            conn.execute(
-                sqlalchemy.text("""
-                    UPDATE chores SET completed = TRUE WHERE id = :chore_id
-                """),
-                {"chore_id": chore_id}
-            )
-    return CompleteAssignmentResponse(
-        message="Marked assignment as complete.",
-        completed_by=username
-    )
+    return await db.run_transaction(transaction)
 
-def assign_users_to_chore(conn, chore_id: int, assignee_ids: list[int]):
+def assign_users_to_chore(conn, chore_id: int, assignee_ids: list[int]) -> list[int]:
     """
-    Helper function to assign multiple users to a chore.
+    Helper function to assign multiple users to a chore in one statement.
+    Repeated ids and users already assigned to the chore are skipped.
+    Returns the ids of the newly created assignments.
     """
-    for user_id in assignee_ids:
-        conn.execute(
-            sqlalchemy.text("""
-                INSERT INTO assignments (chore_id, user_id, assigned_at)
-                VALUES (:chore_id, :user_id, NOW())
-            """),
-            {"chore_id": chore_id, "user_id": user_id}
-        )
+    return conn.execute(
+        sqlalchemy.text("""
+            INSERT INTO assignments (chore_id, user_id, assigned_at)
+            SELECT :chore_id, user_id, NOW()
+            FROM unnest(CAST(:user_ids AS integer[])) AS user_id
+            ON CONFLICT (chore_id, user_id) DO NOTHING
+            RETURNING id
+        """),
+        {"chore_id": chore_id, "user_ids": list(dict.fromkeys(assignee_ids))}
+    ).scalars().all()
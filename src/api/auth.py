@@ -2,24 +2,42 @@ from fastapi import Depends, HTTPException, Header
 from fastapi.security import APIKeyHeader
 import os
 import sqlalchemy
-from src import database as db
+from src import cache, config, database as db
 
 # Extract API key from request headers
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+# Short-lived cache of user context rows keyed by user id
+user_contexts = cache.TTLCache(
+    "user_contexts",
+    config.get_settings().IDENTITY_CACHE_SIZE,
+    config.get_settings().USER_CONTEXT_CACHE_TTL,
+)
+
 def get_api_key(api_key: str = Depends(api_key_header)):
     expected_key = os.getenv("API_KEY")
     if api_key != expected_key:
         raise HTTPException(status_code=403, detail="Invalid or missing API Key")
     return api_key
 
-def get_current_user(x_user_id: str = Header(..., alias="User-Id")):
+async def get_current_user(x_user_id: str = Header(..., alias="User-Id")):
+    """
+    Loads the requesting user's context. FastAPI caches dependency results
+    per request, so routes that depend on this more than once (directly and
+    through require_admin) share a single lookup. Across requests the row is
+    served from a short TTL cache that writers clear with invalidate_user_context.
+    """
     try:
         user_id = int(x_user_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid user ID format")
 
-    with db.engine.begin() as connection:
+    generation = user_contexts.generation
+    user = user_contexts.get(user_id)
+    if user is not cache.MISSING:
+        return dict(user)
+
+    def transaction(connection):
         result = connection.execute(
             sqlalchemy.text("""
                 SELECT id, username, email, group_id, is_admin
@@ -32,7 +50,14 @@ def get_current_user(x_user_id: str = Header(..., alias="User-Id")):
         if not result:
             raise HTTPException(status_code=404, detail="User not found")
 
-        return dict(result)
+        return result
+
+    result = await db.run_transaction(transaction)
+    user_contexts.set(user_id, dict(result), generation)
+    return dict(result)
+
+def invalidate_user_context(*user_ids: int):
+    user_contexts.invalidate(*user_ids)
 
 def get_username(username: str = Header(..., alias="Username")):
     if not username:
@@ -3,7 +3,7 @@ from pydantic import BaseModel
 from datetime import datetime, timedelta
 import sqlalchemy
 from src import database as db
-from src.api import auth
+from src.api import auth, identity
 from src.api.assignments import assign_users_to_chore
 from typing import Optional
 from datetime import datetime
@@ -28,7 +28,7 @@ class ChoreCreatedResponse(BaseModel):
     message: str
 
 @router.post("/", response_model=ChoreCreatedResponse, status_code=status.HTTP_201_CREATED)
-def create_chore(
+async def create_chore(
     chore: ChoreCreate,
 ):
     if not chore.chore_name or not chore.due_date or not chore.description:
@@ -37,19 +37,13 @@ def create_chore(
     if not chore.assignees:
         raise HTTPException(status_code=400, detail="at least one assignee must be specified")
 
-    with db.engine.begin() as conn:
-        user_id = conn.execute(
-            sqlalchemy.text("SELECT id FROM users WHERE username = :username"),
-            {"username": chore.username}
-        ).scalar()
+    def transaction(conn):
+        user_id = identity.get_user_id(conn, chore.username)
 
         if not user_id:
             raise HTTPException(status_code=404, detail="user not found")
 
-        group_id = conn.execute(
-            sqlalchemy.text("SELECT id FROM groups WHERE group_name = :group_name"),
-            {"group_name": chore.group_name}
-        ).scalar()
+        group_id = identity.get_group_id(conn, chore.group_name)
 
         if not group_id:
             raise HTTPException(status_code=404, detail="group not found")
@@ -85,16 +79,15 @@ def create_chore(
         chore_id = result["id"]
         assign_users_to_chore(conn, chore_id, assignee_ids)
 
-    return {"chore_id": chore_id, "message": "chore created"}
+        return {"chore_id": chore_id, "message": "chore created"}
+
+    return await db.run_transaction(transaction)
 
 
 @router.post("/assign-balanced")
-def assign_chore_balanced(chore: ChoreCreate):
-    with db.engine.begin() as conn:
-        group_id = conn.execute(
-            sqlalchemy.text("SELECT id FROM groups WHERE group_name = :group_name"),
-            {"group_name": chore.group_name}
-        ).scalar()
+async def assign_chore_balanced(chore: ChoreCreate):
+    def transaction(conn):
+        group_id = identity.get_group_id(conn, chore.group_name)
 
         if not group_id:
             raise HTTPException(status_code=404, detail="group not found")
@@ -115,10 +108,7 @@ def assign_chore_balanced(chore: ChoreCreate):
         selected = [m["id"] for m in members[:len(chore.assignees)]]
 
 
-        user_id = conn.execute(
-            sqlalchemy.text("SELECT id FROM users WHERE username = :username"),
-            {"username": chore.username}
-        ).scalar()
+        user_id = identity.get_user_id(conn, chore.username)
 
         if not user_id:
             raise HTTPException(status_code=404, detail="User not found")
@@ -140,19 +130,18 @@ def assign_chore_balanced(chore: ChoreCreate):
         chore_id = result["id"]
         assign_users_to_chore(conn, chore_id, selected)
 
-    return {"chore_id": chore_id, "assigned_to": selected, "message": "chore assigned fairly"}
+        return {"chore_id": chore_id, "assigned_to": selected, "message": "chore assigned fairly"}
+
+    return await db.run_transaction(transaction)
 
 
 @router.post("/reminders/send")
-def send_reminders(group_name: str = Body(...), timeframe_hours: int = Body(default=48)):
+async def send_reminders(group_name: str = Body(...), timeframe_hours: int = Body(default=48)):
     now = datetime.now()
     deadline = now + timedelta(hours=timeframe_hours)
 
-    with db.engine.begin() as conn:
-        group_id = conn.execute(
-            sqlalchemy.text("SELECT id FROM groups WHERE group_name = :group_name"),
-            {"group_name": group_name}
-        ).scalar()
+    def transaction(conn):
+        group_id = identity.get_group_id(conn, group_name)
 
         if not group_id:
             raise HTTPException(status_code=404, detail="group not found")
@@ -178,10 +167,12 @@ def send_reminders(group_name: str = Body(...), timeframe_hours: int = Body(defa
 
         return {"reminders_sent": reminders_sent}
 
+    return await db.run_transaction(transaction)
+
 
 @router.patch("/{chore_id}/archive")
-def archive_chore(chore_id: int, user=Depends(auth.get_current_user)):
-    with db.engine.begin() as conn:
+async def archive_chore(chore_id: int, user=Depends(auth.get_current_user)):
+    def transaction(conn):
         result = conn.execute(
             sqlalchemy.text("""
                 UPDATE chores
@@ -195,7 +186,9 @@ def archive_chore(chore_id: int, user=Depends(auth.get_current_user)):
         if not result:
             raise HTTPException(status_code=404, detail="chore not found")
 
-    return {"message": "chore archived"}
+        return {"message": "chore archived"}
+
+    return await db.run_transaction(transaction)
 
 class ChoreDuplicateRequest(BaseModel):
     new_due_date: Optional[datetime] = None
@@ -203,12 +196,12 @@ class ChoreDuplicateRequest(BaseModel):
     recurring: Optional[str] = None
 
 @router.post("/{chore_id}/duplicate", response_model=ChoreCreatedResponse)
-def duplicate_chore(
+async def duplicate_chore(
     chore_id: int,
     request: ChoreDuplicateRequest,
     username: str
 ):
-    with db.engine.begin() as conn:
+    def transaction(conn):
         chore = conn.execute(sqlalchemy.text("""
             SELECT * FROM chores WHERE id = :id
         """), {"id": chore_id}).mappings().fetchone()
@@ -216,17 +209,9 @@ def duplicate_chore(
         if not chore:
             raise HTTPException(status_code=404, detail="Original chore not found")
 
-        user_id = conn.execute(
-            sqlalchemy.text("SELECT id FROM users WHERE username = :username"),
-            {"username": username}
-        ).scalar()
+        user = identity.get_user(conn, username)
 
-        group_check = conn.execute(
-            sqlalchemy.text("SELECT group_id FROM users WHERE id = :user_id"),
-            {"user_id": user_id}
-        ).scalar()
-
-        if group_check != chore["group_id"]:
+        if not user or user.group_id != chore["group_id"]:
             raise HTTPException(status_code=403, detail="Not authorized to duplicate this chore")
 
         new_due_date = request.new_due_date or chore["due_date"]
@@ -243,7 +228,7 @@ def duplicate_chore(
             "due_date": new_due_date,
             "is_recurring": new_recurrence is not None,
             "recurrence_pattern": new_recurrence,
-            "created_by": user_id
+            "created_by": user.id
         }).mappings().fetchone()
 
         new_chore_id = result["id"]
@@ -266,5 +251,7 @@ def duplicate_chore(
 
         assign_users_to_chore(conn, new_chore_id, assignee_ids)
 
-    return {"chore_id": new_chore_id, "message": "Chore duplicated successfully"}
+        return {"chore_id": new_chore_id, "message": "Chore duplicated successfully"}
+
+    return await db.run_transaction(transaction)
 
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 import sqlalchemy
 from src import database as db
-from src.api import auth
+from src.api import auth, identity
 from pydantic import BaseModel
 from typing import Optional
 
@@ -19,11 +19,11 @@ class GroupResponse(BaseModel):
 router = APIRouter(prefix="/groups", tags=["groups"])
 
 @router.post("/create", response_model=GroupResponse, status_code=status.HTTP_201_CREATED)
-def create_group(group: Group):
+async def create_group(group: Group):
     """
     Create a new group and assign the requesting user to it.
     """
-    with db.engine.begin() as connection:
+    def transaction(connection):
         result = connection.execute(
             sqlalchemy.text(
                 """
@@ -41,15 +41,10 @@ def create_group(group: Group):
                 detail="Group creation failed."
             )
 
-                # Get the user by username
-        user = connection.execute(
-            sqlalchemy.text("""
-                SELECT id FROM users WHERE username = :username
-            """),
-            {"username": group.username}
-        ).mappings().fetchone()
+        # Get the user by username
+        user_id = identity.get_user_id(connection, group.username)
 
-        if not user:
+        if not user_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found."
@@ -62,10 +57,15 @@ def create_group(group: Group):
                 SET group_id = :group_id, is_admin = TRUE
                 WHERE id = :user_id
             """),
-            {"group_id": result["id"], "user_id": user["id"]}
+            {"group_id": result["id"], "user_id": user_id}
         )
 
-    return {"id": result["id"], "name": result["group_name"]}
+        return user_id, {"id": result["id"], "name": result["group_name"]}
+
+    user_id, response = await db.run_transaction(transaction)
+    identity.invalidate_user(group.username)
+    auth.invalidate_user_context(user_id)
+    return response
 
 class JoinGroupRequest(BaseModel):
     group_name: str
@@ -73,11 +73,11 @@ class JoinGroupRequest(BaseModel):
     username: str
 
 @router.post("/join", response_model=GroupResponse, status_code=status.HTTP_200_OK)
-def join_group(request: JoinGroupRequest):
+async def join_group(request: JoinGroupRequest):
     """
     Join a group using the group name, invite code, and username.
     """
-    with db.engine.begin() as connection:
+    def transaction(connection):
         group = connection.execute(
             sqlalchemy.text(
                 """
@@ -95,14 +95,9 @@ def join_group(request: JoinGroupRequest):
         if group["invite_code"] != request.invite_code:
             raise HTTPException(status_code=400, detail="Invalid invite code.")
 
-        user = connection.execute(
-            sqlalchemy.text("""
-                SELECT id FROM users WHERE username = :username
-            """),
-            {"username": request.username}
-        ).mappings().fetchone()
+        user_id = identity.get_user_id(connection, request.username)
 
-        if not user:
+        if not user_id:
             raise HTTPException(status_code=404, detail="User not found.")
 
         updated = connection.execute(
@@ -114,32 +109,32 @@ def join_group(request: JoinGroupRequest):
                 RETURNING id
                 """
             ),
-            {"group_id": group["id"], "user_id": user["id"]},
+            {"group_id": group["id"], "user_id": user_id},
         ).fetchone()
 
         if not updated:
             raise HTTPException(status_code=400, detail="Group join failed.")
 
-    return {"message": request.username + " has joined the group.", "id": group["id"], "name": group["group_name"], "invite_code": group["invite_code"]}
+        return user_id, {"message": request.username + " has joined the group.", "id": group["id"], "name": group["group_name"], "invite_code": group["invite_code"]}
+
+    user_id, response = await db.run_transaction(transaction)
+    identity.invalidate_user(request.username)
+    auth.invalidate_user_context(user_id)
+    return response
 
 
 class LeaveGroupRequest(BaseModel):
     username: str
 
 @router.post("/leave")
-def leave_group(request: LeaveGroupRequest):
+async def leave_group(request: LeaveGroupRequest):
     """
     Remove the user from their current group using their username.
     """
-    with db.engine.begin() as conn:
-        user = conn.execute(
-            sqlalchemy.text("""
-                SELECT id FROM users WHERE username = :username
-            """),
-            {"username": request.username}
-        ).mappings().fetchone()
+    def transaction(conn):
+        user_id = identity.get_user_id(conn, request.username)
 
-        if not user:
+        if not user_id:
             raise HTTPException(status_code=404, detail="User not found.")
 
         result = conn.execute(
@@ -149,10 +144,15 @@ def leave_group(request: LeaveGroupRequest):
                 WHERE id = :id
                 RETURNING id
             """),
-            {"id": user["id"]}
+            {"id": user_id}
         ).fetchone()
 
         if not result:
             raise HTTPException(status_code=404, detail="User not found.")
 
+        return user_id
+
+    user_id = await db.run_transaction(transaction)
+    identity.invalidate_user(request.username)
+    auth.invalidate_user_context(user_id)
     return {"message": "You have left the group."}
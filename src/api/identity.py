@@ -0,0 +1,80 @@
+"""
+Cached resolution of usernames and group names to database ids.
+
+Nearly every endpoint starts by turning a name into an id. The mappings
+change only on a handful of writes, so they are kept in per-process
+LRU+TTL caches. Writers must call the matching invalidate function after
+their transaction commits.
+"""
+from typing import NamedTuple
+import sqlalchemy
+from src import cache, config
+
+settings = config.get_settings()
+
+users = cache.TTLCache("users_by_name", settings.IDENTITY_CACHE_SIZE, settings.IDENTITY_CACHE_TTL)
+groups = cache.TTLCache("groups_by_name", settings.IDENTITY_CACHE_SIZE, settings.IDENTITY_CACHE_TTL)
+
+
+class UserIdentity(NamedTuple):
+    id: int
+    group_id: int | None
+
+
+def get_user(conn, username: str) -> UserIdentity | None:
+    """
+    Returns the id and current group of a user, or None if it does not exist.
+    """
+    generation = users.generation
+    user = users.get(username)
+    if user is not cache.MISSING:
+        return user
+
+    row = conn.execute(
+        sqlalchemy.text("SELECT id, group_id FROM users WHERE username = :username"),
+        {"username": username}
+    ).fetchone()
+    if row is None:
+        return None
+
+    user = UserIdentity(row.id, row.group_id)
+    users.set(username, user, generation)
+    return user
+
+
+def get_user_id(conn, username: str) -> int | None:
+    user = get_user(conn, username)
+    return user.id if user else None
+
+
+def get_group_id(conn, group_name: str) -> int | None:
+    """
+    Returns the id of a group, or None if it does not exist.
+    """
+    generation = groups.generation
+    group_id = groups.get(group_name)
+    if group_id is not cache.MISSING:
+        return group_id
+
+    group_id = conn.execute(
+        sqlalchemy.text("SELECT id FROM groups WHERE group_name = :group_name"),
+        {"group_name": group_name}
+    ).scalar()
+    if group_id is None:
+        return None
+
+    groups.set(group_name, group_id, generation)
+    return group_id
+
+
+def invalidate_user(*usernames: str):
+    users.invalidate(*usernames)
+
+
+def invalidate_group(*group_names: str):
+    groups.invalidate(*group_names)
+
+
+def invalidate_all():
+    users.clear()
+    groups.clear()
@@ -3,7 +3,7 @@ from typing import Optional, List, Union
 import sqlalchemy
 from pydantic import BaseModel
 from src import database as db
-from src.api import auth
+from src.api import auth, identity
 from datetime import datetime
 
 router = APIRouter(
@@ -25,7 +25,7 @@ class NoChoresResponse(BaseModel):
     message: str
 
 @router.post("/", response_model=CreateUserResponse, status_code=201)
-def create_user(username: str, email: str):
+async def create_user(username: str, email: str):
     """
     Create a new user if the email is not already taken.
 
@@ -39,7 +39,7 @@ def create_user(username: str, email: str):
     if not username or not email:
         raise HTTPException(status_code=400, detail="Username and email are required.")
 
-    with db.engine.begin() as connection:
+    def transaction(connection):
         existing_user = connection.execute(
             sqlalchemy.text("SELECT id FROM users WHERE email = :email"),
             {"email": email}
@@ -57,10 +57,14 @@ def create_user(username: str, email: str):
             {"username": username, "email": email}
         ).mappings().fetchone()
 
-    return CreateUserResponse(user_id=result["id"], message="User created successfully.")
+        return CreateUserResponse(user_id=result["id"], message="User created successfully.")
+
+    response = await db.run_transaction(transaction)
+    identity.invalidate_user(username)
+    return response
 
 @router.get("/{user_id}/chores", response_model=Union[List[ChoreInfo], NoChoresResponse])
-def get_user_chores(
+async def get_user_chores(
     username: str,
     completed: Optional[bool] = Query(None)
 ):
@@ -71,17 +75,10 @@ def get_user_chores(
     Supports filtering by:
         - completion status (`completed`)
     """
-    with db.engine.begin() as connection:
-        user_id = connection.execute(
-            sqlalchemy.text("SELECT id FROM users WHERE username = :username"),
-            {"username": username}
-        ).scalar()
-        user_exists = connection.execute(
-            sqlalchemy.text("SELECT 1 FROM users WHERE id = :user_id"),
-            {"user_id": user_id}
-        ).first()
+    def transaction(connection):
+        user_id = identity.get_user_id(connection, username)
 
-        if not user_exists:
+        if not user_id:
             raise HTTPException(status_code=404, detail="User not found.")
 
         query = """
@@ -98,6 +95,8 @@ def get_user_chores(
 
         chores = connection.execute(sqlalchemy.text(query), params).mappings().all()
 
-    if chores:
-        return [ChoreInfo(**row) for row in chores]
-    return NoChoresResponse(message="No chores assigned.")
+        if chores:
+            return [ChoreInfo(**row) for row in chores]
+        return NoChoresResponse(message="No chores assigned.")
+
+    return await db.run_transaction(transaction)
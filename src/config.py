@@ -12,6 +12,12 @@ load_dotenv(dotenv_path=find_dotenv(".env"), override=True)
 class Settings:
     API_KEY: str | None = os.getenv("API_KEY")
     POSTGRES_URI: str | None = os.getenv("POSTGRES_URI")
+    IDENTITY_CACHE_SIZE: int = int(os.getenv("IDENTITY_CACHE_SIZE", "50000"))
+    IDENTITY_CACHE_TTL: float = float(os.getenv("IDENTITY_CACHE_TTL", "30"))
+    USER_CONTEXT_CACHE_TTL: float = float(os.getenv("USER_CONTEXT_CACHE_TTL", "5"))
+    DATABASE_ASYNC: bool = os.getenv("DATABASE_ASYNC", "false").lower() in ("1", "true", "yes")
+    ASYNC_POOL_SIZE: int = int(os.getenv("ASYNC_POOL_SIZE", "20"))
+    ASYNC_MAX_OVERFLOW: int = int(os.getenv("ASYNC_MAX_OVERFLOW", "10"))
 
     def __init__(self):
         if not self.API_KEY:
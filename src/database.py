@@ -1,8 +1,44 @@
+from typing import Any, Callable
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import declarative_base
+from starlette.concurrency import run_in_threadpool
 from src import config
 
 Base = declarative_base()
 
-connection_url = config.get_settings().POSTGRES_URI
+settings = config.get_settings()
+connection_url = settings.POSTGRES_URI
 engine = create_engine(connection_url, pool_pre_ping=True)
+
+# Opt-in: with DATABASE_ASYNC set, transactions run on the event loop through
+# psycopg's async driver instead of occupying Starlette threadpool workers.
+async_engine = None
+if settings.DATABASE_ASYNC:
+    async_engine = create_async_engine(
+        connection_url,
+        pool_pre_ping=True,
+        pool_size=settings.ASYNC_POOL_SIZE,
+        max_overflow=settings.ASYNC_MAX_OVERFLOW,
+    )
+
+
+def _run_sync_transaction(fn: Callable[..., Any], *args) -> Any:
+    with engine.begin() as conn:
+        return fn(conn, *args)
+
+
+async def run_transaction(fn: Callable[..., Any], *args) -> Any:
+    """
+    Runs fn(conn, *args) inside a transaction and returns its result.
+
+    fn is plain synchronous SQLAlchemy code either way. In async mode it runs
+    through AsyncConnection.run_sync, so every statement awaits the async
+    driver on the event loop; otherwise it runs on the threadpool against the
+    sync engine.
+    """
+    if async_engine is None:
+        return await run_in_threadpool(_run_sync_transaction, fn, *args)
+
+    async with async_engine.begin() as conn:
+        return await conn.run_sync(fn, *args)
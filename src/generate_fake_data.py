@@ -1,89 +1,273 @@
+"""
+Seed the database with fake groups, users, chores and assignments.
+
+Rows are generated in fixed-size chunks and streamed into Postgres with
+psycopg's COPY ... FROM STDIN. Each chunk draws from its own RNG seeded from
+(seed, table, chunk), so a given seed always produces the same dataset no
+matter how many workers load it.
+
+    python -m src.generate_fake_data --scale 0.1 --seed 42 --workers 4
+"""
+import argparse
 import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from faker import Faker
 from tqdm import tqdm
 from sqlalchemy import text
 from src.database import engine
 
-fake = Faker()
-
 NUM_USERS = 100_000
 NUM_GROUPS = 10_000
 NUM_CHORES = 500_000
 NUM_ASSIGNMENTS = 390_000
 
-with engine.begin() as conn:
-    # Insert groups
-    print("Inserting groups...")
-    for i in tqdm(range(1, NUM_GROUPS + 1)):
-        conn.execute(
-            text("""
-                INSERT INTO groups (group_name, created_at, invite_code)
-                VALUES (:name, :created_at, :invite_code)
-            """),
-            {
-                "name": f"Group {i}",
-                "created_at": fake.date_time_between(start_date='-2y', end_date='now'),
-                "invite_code": fake.bothify(text='????-####')
-            }
+CHUNK_SIZE = 20_000
+TABLE_ORDER = ["groups", "users", "chores", "assignments"]
+
+# Large prime used to spread assignment rows over distinct chores.
+_CHORE_STRIDE = 1_000_003
+
+ONE_YEAR = timedelta(days=365).total_seconds()
+
+
+@dataclass
+class LoadPlan:
+    counts: dict[str, int]
+    offsets: dict[str, int]
+    seed: int
+    chunk_size: int
+    now: datetime
+
+
+def _chunk_rng(plan: LoadPlan, table: str, chunk: int) -> tuple[random.Random, Faker]:
+    # String seeds hash deterministically, unlike hash() across processes.
+    rng = random.Random(f"{plan.seed}:{table}:{chunk}")
+    fake = Faker()
+    fake.seed_instance(rng.getrandbits(32))
+    return rng, fake
+
+
+def _past(rng: random.Random, now: datetime, seconds: float) -> datetime:
+    return now - timedelta(seconds=rng.uniform(0, seconds))
+
+
+def _group_rows(plan, rng, fake, start, stop):
+    for i in range(start, stop):
+        group_id = plan.offsets["groups"] + i + 1
+        yield (
+            group_id,
+            f"Group {group_id}",
+            _past(rng, plan.now, 2 * ONE_YEAR),
+            fake.bothify(text="????-####"),
         )
 
-    group_ids = [row[0] for row in conn.execute(text("SELECT id FROM groups")).fetchall()]
-    print(f"Inserted {len(group_ids)} groups.")
-
-    # Insert users
-    print("Inserting users...")
-    for i in tqdm(range(NUM_USERS)):
-        conn.execute(
-            text("""
-                INSERT INTO users (username, email, group_id)
-                VALUES (:username, :email, :group_id)
-            """),
-            {
-                "username": f"user{i}",
-                "email": fake.email(),
-                "group_id": random.choice(group_ids)
-            }
+
+def _user_rows(plan, rng, fake, start, stop):
+    for i in range(start, stop):
+        user_id = plan.offsets["users"] + i + 1
+        yield (
+            user_id,
+            f"user{user_id}",
+            f"user{user_id}@{fake.free_email_domain()}",
+            False,
+            plan.offsets["groups"] + rng.randint(1, plan.counts["groups"]),
         )
 
-    user_ids = [row[0] for row in conn.execute(text("SELECT id FROM users")).fetchall()]
-
-    # Insert chores
-    print("Inserting chores...")
-    for _ in tqdm(range(NUM_CHORES)):
-        conn.execute(
-            text("""
-                INSERT INTO chores (group_id, name, description, due_date, created_by)
-                VALUES (:group_id, :name, :desc, :due_date, :created_by)
-            """),
-            {
-                "group_id": random.choice(group_ids),
-                "name": fake.job()[:50],
-                "desc": fake.sentence(),
-                "due_date": fake.date_time_between(start_date='-1y', end_date='now'),
-                "created_by": random.choice(user_ids)
-            }
+
+def _chore_rows(plan, rng, fake, start, stop):
+    for i in range(start, stop):
+        yield (
+            plan.offsets["chores"] + i + 1,
+            plan.offsets["groups"] + rng.randint(1, plan.counts["groups"]),
+            fake.job()[:50],
+            fake.sentence()[:200],
+            _past(rng, plan.now, ONE_YEAR),
+            plan.offsets["users"] + rng.randint(1, plan.counts["users"]),
+            False,
+            False,
+            False,
+            _past(rng, plan.now, ONE_YEAR),
         )
 
-    chore_ids = [row[0] for row in conn.execute(text("SELECT id FROM chores")).fetchall()]
-
-    # Insert assignments
-    print("Inserting assignments...")
-    for _ in tqdm(range(NUM_ASSIGNMENTS)):
-        conn.execute(
-            text("""
-                INSERT INTO assignments (chore_id, user_id, assigned_at)
-                VALUES (:chore, :user, :assigned_at)
-            """),
-            {
-                "chore": random.choice(chore_ids),
-                "user": random.choice(user_ids),
-                "assigned_at": fake.date_time_between(start_date='-1y', end_date='now')
-            }
+
+def _assignment_rows(plan, rng, fake, start, stop):
+    # Every assignment lands on a distinct chore, which keeps
+    # (chore_id, user_id) unique without a global dedup pass.
+    num_chores = plan.counts["chores"]
+    for i in range(start, stop):
+        yield (
+            plan.offsets["assignments"] + i + 1,
+            plan.offsets["chores"] + (i * _CHORE_STRIDE) % num_chores + 1,
+            plan.offsets["users"] + rng.randint(1, plan.counts["users"]),
+            _past(rng, plan.now, ONE_YEAR),
         )
 
-# Run VACUUM ANALYZE outside of transaction block
-with engine.connect() as conn:
-    print("🧹 Running VACUUM ANALYZE...")
-    conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("VACUUM ANALYZE"))
 
-print("Fake data generation complete.")
+COPY_SPECS = {
+    "groups": (
+        "COPY groups (id, group_name, created_at, invite_code) FROM STDIN",
+        _group_rows,
+    ),
+    "users": (
+        "COPY users (id, username, email, is_admin, group_id) FROM STDIN",
+        _user_rows,
+    ),
+    "chores": (
+        """COPY chores (id, group_id, name, description, due_date, created_by,
+                        is_recurring, completed, archived, created_at) FROM STDIN""",
+        _chore_rows,
+    ),
+    "assignments": (
+        "COPY assignments (id, chore_id, user_id, assigned_at) FROM STDIN",
+        _assignment_rows,
+    ),
+}
+
+
+def _reset_worker_pool():
+    # Forked workers must not reuse the parent's pooled connections.
+    engine.dispose(close=False)
+
+
+def load_chunk(plan: LoadPlan, table: str, chunk: int) -> int:
+    """
+    Generate one chunk of rows for a table and COPY it in its own transaction.
+    Returns the number of rows written.
+    """
+    start = chunk * plan.chunk_size
+    stop = min(start + plan.chunk_size, plan.counts[table])
+    copy_sql, row_factory = COPY_SPECS[table]
+    rng, fake = _chunk_rng(plan, table, chunk)
+
+    raw = engine.raw_connection()
+    try:
+        with raw.driver_connection.cursor() as cur:
+            with cur.copy(copy_sql) as copy:
+                for row in row_factory(plan, rng, fake, start, stop):
+                    copy.write_row(row)
+        raw.commit()
+    finally:
+        raw.close()
+    return stop - start
+
+
+def load_table(plan: LoadPlan, table: str, pool: ProcessPoolExecutor | None) -> float:
+    """
+    Load every chunk of a table, in parallel when a worker pool is given.
+    Returns elapsed seconds.
+    """
+    num_chunks = -(-plan.counts[table] // plan.chunk_size)
+    started = time.perf_counter()
+    with tqdm(total=plan.counts[table], desc=table, unit="rows") as bar:
+        if pool is None:
+            for chunk in range(num_chunks):
+                bar.update(load_chunk(plan, table, chunk))
+        else:
+            futures = [pool.submit(load_chunk, plan, table, chunk) for chunk in range(num_chunks)]
+            for future in as_completed(futures):
+                bar.update(future.result())
+    return time.perf_counter() - started
+
+
+def build_plan(counts: dict[str, int], seed: int, chunk_size: int) -> LoadPlan:
+    """
+    Read the current max id of every table so generated ids and foreign keys
+    continue after any rows already present.
+    """
+    with engine.begin() as conn:
+        offsets = {
+            table: conn.execute(text(f"SELECT COALESCE(MAX(id), 0) FROM {table}")).scalar()
+            for table in TABLE_ORDER
+        }
+    return LoadPlan(
+        counts=counts,
+        offsets=offsets,
+        seed=seed,
+        chunk_size=chunk_size,
+        now=datetime.now().replace(microsecond=0),
+    )
+
+
+def sync_sequences():
+    """
+    COPY with explicit ids bypasses the serial sequences; move them past the
+    loaded rows so the API keeps inserting without collisions.
+    """
+    with engine.begin() as conn:
+        for table in TABLE_ORDER:
+            conn.execute(text(f"""
+                SELECT setval(pg_get_serial_sequence('{table}', 'id'),
+                              (SELECT COALESCE(MAX(id), 1) FROM {table}))
+            """))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-load fake data with COPY.")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiplier applied to the default row counts.")
+    parser.add_argument("--groups", type=int, help="Override the number of groups.")
+    parser.add_argument("--users", type=int, help="Override the number of users.")
+    parser.add_argument("--chores", type=int, help="Override the number of chores.")
+    parser.add_argument("--assignments", type=int, help="Override the number of assignments.")
+    parser.add_argument("--seed", type=int, default=365, help="Seed for deterministic output.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes per table (1 loads inline).")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--skip-vacuum", action="store_true")
+    return parser.parse_args(argv)
+
+
+def resolve_counts(args) -> dict[str, int]:
+    defaults = {
+        "groups": NUM_GROUPS,
+        "users": NUM_USERS,
+        "chores": NUM_CHORES,
+        "assignments": NUM_ASSIGNMENTS,
+    }
+    counts = {
+        table: getattr(args, table) if getattr(args, table) is not None else max(1, int(n * args.scale))
+        for table, n in defaults.items()
+    }
+    # Each assignment targets a distinct chore.
+    counts["assignments"] = min(counts["assignments"], counts["chores"])
+    return counts
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    plan = build_plan(resolve_counts(args), args.seed, args.chunk_size)
+
+    timings = {}
+    pool = None
+    if args.workers > 1:
+        pool = ProcessPoolExecutor(max_workers=args.workers, initializer=_reset_worker_pool)
+    try:
+        for table in TABLE_ORDER:
+            timings[table] = load_table(plan, table, pool)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    sync_sequences()
+
+    if not args.skip_vacuum:
+        # Run VACUUM ANALYZE outside of transaction block
+        with engine.connect() as conn:
+            print("🧹 Running VACUUM ANALYZE...")
+            conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("VACUUM ANALYZE"))
+
+    print(f"\n{'table':<12} {'rows':>10} {'seconds':>9} {'rows/sec':>12}")
+    for table in TABLE_ORDER:
+        rows, seconds = plan.counts[table], timings[table]
+        print(f"{table:<12} {rows:>10,} {seconds:>9.2f} {rows / max(seconds, 1e-9):>12,.0f}")
+    total_rows, total_seconds = sum(plan.counts.values()), sum(timings.values())
+    print(f"{'total':<12} {total_rows:>10,} {total_seconds:>9.2f} {total_rows / max(total_seconds, 1e-9):>12,.0f}")
+
+    print("Fake data generation complete.")
+
+
+if __name__ == "__main__":
+    main()
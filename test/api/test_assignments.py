@@ -0,0 +1,68 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import sqlalchemy
+from fastapi import HTTPException
+from src.api.assignments import assign_users_to_chore, mark_assignment_complete
+
+
+def test_assign_users_to_chore_single_statement(conn, make_group, make_chore) -> None:
+    group_id, user_ids = make_group(5)
+    chore_id = make_chore(group_id, user_ids[0])
+
+    created = assign_users_to_chore(conn, chore_id, user_ids)
+
+    assert len(created) == 5
+    assert conn.execute(
+        sqlalchemy.text("SELECT COUNT(*) FROM assignments WHERE chore_id = :id"),
+        {"id": chore_id}
+    ).scalar() == 5
+
+
+def test_assign_users_to_chore_skips_duplicates(conn, make_group, make_chore) -> None:
+    group_id, user_ids = make_group(3)
+    chore_id = make_chore(group_id, user_ids[0])
+
+    first = assign_users_to_chore(conn, chore_id, [user_ids[0], user_ids[0], user_ids[1]])
+    second = assign_users_to_chore(conn, chore_id, user_ids)
+
+    assert len(first) == 2
+    assert len(second) == 1
+
+
+def test_concurrent_completion_flips_every_chore(engine, committed_group) -> None:
+    _, users, chore_ids = committed_group(size=8, chores=25)
+    with engine.begin() as conn:
+        assignments = conn.execute(
+            sqlalchemy.text("SELECT id, user_id FROM assignments WHERE chore_id = ANY(:ids)"),
+            {"ids": chore_ids}
+        ).all()
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        futures = [
+            pool.submit(asyncio.run, mark_assignment_complete(assignment_id, users[user_id], None))
+            for assignment_id, user_id in assignments
+        ]
+        for future in futures:
+            future.result()
+
+    with engine.begin() as conn:
+        open_chores = conn.execute(
+            sqlalchemy.text("SELECT COUNT(*) FROM chores WHERE id = ANY(:ids) AND completed IS NOT TRUE"),
+            {"ids": chore_ids}
+        ).scalar()
+    assert open_chores == 0
+
+
+def test_completion_rejects_other_users(engine, committed_group) -> None:
+    _, users, chore_ids = committed_group(size=2, chores=1)
+    owner_id, other_id = sorted(users)
+    with engine.begin() as conn:
+        assignment_id = conn.execute(
+            sqlalchemy.text("SELECT id FROM assignments WHERE chore_id = :c AND user_id = :u"),
+            {"c": chore_ids[0], "u": owner_id}
+        ).scalar_one()
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(mark_assignment_complete(assignment_id, users[other_id], None))
+    assert excinfo.value.status_code == 403
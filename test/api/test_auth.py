@@ -0,0 +1,27 @@
+import asyncio
+from src.api import auth
+
+
+def test_current_user_is_served_from_cache(committed_group) -> None:
+    _, users, _ = committed_group(size=1, chores=0)
+    user_id = next(iter(users))
+    hits = auth.user_contexts.hits
+
+    first = asyncio.run(auth.get_current_user(str(user_id)))
+    second = asyncio.run(auth.get_current_user(str(user_id)))
+
+    assert first == second
+    assert first["username"] == users[user_id]
+    assert auth.user_contexts.hits == hits + 1
+
+
+def test_invalidated_user_context_is_reloaded(committed_group) -> None:
+    _, users, _ = committed_group(size=1, chores=0)
+    user_id = next(iter(users))
+    asyncio.run(auth.get_current_user(str(user_id)))
+    misses = auth.user_contexts.misses
+
+    auth.invalidate_user_context(user_id)
+    asyncio.run(auth.get_current_user(str(user_id)))
+
+    assert auth.user_contexts.misses == misses + 1
@@ -0,0 +1,116 @@
+import uuid
+import pytest
+import sqlalchemy
+from src import database as db
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """
+    The configured database engine, or a skip when Postgres is not reachable.
+    """
+    try:
+        with db.engine.connect() as conn:
+            conn.execute(sqlalchemy.text("SELECT 1"))
+    except sqlalchemy.exc.OperationalError:
+        pytest.skip("database not available")
+    return db.engine
+
+
+@pytest.fixture
+def conn(engine):
+    """
+    A connection inside a transaction that is rolled back after the test.
+    """
+    with engine.connect() as connection:
+        tx = connection.begin()
+        yield connection
+        tx.rollback()
+
+
+@pytest.fixture
+def make_group(conn):
+    """
+    Factory creating a group with `size` members. Returns (group_id, user_ids).
+    """
+    def _make(size: int = 3):
+        tag = uuid.uuid4().hex[:8]
+        group_id = conn.execute(sqlalchemy.text("""
+            INSERT INTO groups (group_name, created_at, invite_code)
+            VALUES (:name, NOW(), 'TEST')
+            RETURNING id
+        """), {"name": f"test-{tag}"}).scalar_one()
+        user_ids = conn.execute(sqlalchemy.text("""
+            INSERT INTO users (username, email, is_admin, group_id)
+            SELECT 'test-' || :tag || '-' || n, 'test-' || :tag || '-' || n || '@example.com', false, :group_id
+            FROM generate_series(1, :size) AS n
+            RETURNING id
+        """), {"tag": tag, "size": size, "group_id": group_id}).scalars().all()
+        return group_id, user_ids
+    return _make
+
+
+@pytest.fixture
+def make_chore(conn):
+    """
+    Factory inserting an open chore in a group. Returns the chore id.
+    """
+    def _make(group_id: int, created_by: int, **overrides):
+        params = {"due_date": None, "name": "test chore", **overrides}
+        return conn.execute(sqlalchemy.text("""
+            INSERT INTO chores (name, description, group_id, due_date, created_by, completed, created_at)
+            VALUES (:name, 'test', :group_id, COALESCE(:due_date, NOW() + INTERVAL '1 day'), :created_by, false, NOW())
+            RETURNING id
+        """), {"group_id": group_id, "created_by": created_by, **params}).scalar_one()
+    return _make
+
+
+@pytest.fixture
+def committed_group(engine):
+    """
+    Factory committing a group with members and chores assigned to every
+    member, for tests that need several connections to see the same rows.
+    Returns (group_id, users, chore_ids) where users maps id -> username.
+    Everything created is deleted after the test.
+    """
+    created = []
+
+    def _make(size: int = 3, chores: int = 1):
+        tag = uuid.uuid4().hex[:8]
+        with engine.begin() as conn:
+            group_id = conn.execute(sqlalchemy.text("""
+                INSERT INTO groups (group_name, created_at, invite_code)
+                VALUES (:name, NOW(), 'TEST')
+                RETURNING id
+            """), {"name": f"test-{tag}"}).scalar_one()
+            users = dict(conn.execute(sqlalchemy.text("""
+                INSERT INTO users (username, email, is_admin, group_id)
+                SELECT 'test-' || :tag || '-' || n, 'test-' || :tag || '-' || n || '@example.com', false, :group_id
+                FROM generate_series(1, :size) AS n
+                RETURNING id, username
+            """), {"tag": tag, "size": size, "group_id": group_id}).all())
+            chore_ids = conn.execute(sqlalchemy.text("""
+                INSERT INTO chores (name, description, group_id, due_date, created_by, completed, created_at)
+                SELECT 'test chore ' || n, 'test', :group_id, NOW() + INTERVAL '1 day', :created_by, false, NOW()
+                FROM generate_series(1, :chores) AS n
+                RETURNING id
+            """), {"group_id": group_id, "created_by": min(users), "chores": chores}).scalars().all()
+            conn.execute(sqlalchemy.text("""
+                INSERT INTO assignments (chore_id, user_id, assigned_at)
+                SELECT c, u, NOW()
+                FROM unnest(CAST(:chore_ids AS integer[])) AS c
+                CROSS JOIN unnest(CAST(:user_ids AS integer[])) AS u
+            """), {"chore_ids": chore_ids, "user_ids": list(users)})
+        created.append(group_id)
+        return group_id, users, chore_ids
+
+    yield _make
+
+    with engine.begin() as conn:
+        for group_id in created:
+            conn.execute(sqlalchemy.text("""
+                DELETE FROM assignments WHERE chore_id IN (SELECT id FROM chores WHERE group_id = :g)
+            """), {"g": group_id})
+            conn.execute(sqlalchemy.text("DELETE FROM chores WHERE group_id = :g"), {"g": group_id})
+            conn.execute(sqlalchemy.text("DELETE FROM users WHERE group_id = :g"), {"g": group_id})
+            conn.execute(sqlalchemy.text("DELETE FROM groups WHERE id = :g"), {"g": group_id})
@@ -0,0 +1,32 @@
+import time
+from src.cache import MISSING, TTLCache
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache = TTLCache("test_lru", maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_expires_entries() -> None:
+    cache = TTLCache("test_ttl", maxsize=10, ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+
+    assert cache.get("a") is MISSING
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_cache_drops_values_loaded_before_invalidation() -> None:
+    cache = TTLCache("test_generation", maxsize=10, ttl=60)
+    generation = cache.generation
+    cache.invalidate("a")
+    cache.set("a", "stale", generation)
+
+    assert cache.get("a") is MISSING